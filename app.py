@@ -1,83 +1,74 @@
 import streamlit as st
 import google.generativeai as genai
-from PIL import Image
+from PIL import Image, ImageOps
 import io
-import json
+import orjson
+import hashlib
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # --- Page Configuration ---
 st.set_page_config(page_title="AI Medical Consultant", page_icon="🧑‍⚕️", layout="wide")
 
-# --- Load LLM Model ---
-@st.cache_resource
-def load_llm():
-    try:
-        genai.configure(api_key=st.secrets["GOOGLE_API_KEY"])
-        llm = genai.GenerativeModel('gemini-1.5-flash-latest')
-        return llm
-    except KeyError:
-        st.error("🚨 Google API Key not found! Please add it to your Streamlit secrets.")
-        st.stop()
-    except Exception as e:
-        st.error(f"An error occurred during model loading: {e}")
-        st.stop()
-
-model = load_llm()
-
-# --- Core API Functions ---
-def get_gemini_json_response(prompt, image=None):
-    """Gets a JSON response from Gemini, for generating questions."""
-    content = [prompt, image] if image else [prompt]
-    try:
-        response = model.generate_content(content)
-        cleaned_response = response.text.strip().replace("```json", "").replace("```", "")
-        return cleaned_response
-    except Exception as e:
-        return f'{{"error": "API communication failed: {e}"}}'
-
-def get_gemini_text_response(prompt, image=None):
-    """Gets a standard text/markdown response from Gemini, for the final analysis."""
-    content = [prompt, image] if image else [prompt]
-    try:
-        response = model.generate_content(content)
-        return response.text
-    except Exception as e:
-        return f"Error: API communication failed. {e}"
-
-# --- Prompt Engineering Functions ---
-def create_triage_prompt():
-    """Prompt 1: Asks the AI to generate triage questions based on the image."""
-    return """
+# --- Prompt Templates ---
+# Prompt 1: Attached as the triage model's system instruction; each call only adds the image.
+TRIAGE_SYSTEM_INSTRUCTION = """
     You are an AI Triage Assistant. Look at the provided medical image and generate 2-3 important, multiple-choice questions to ask the user for context.
-    Return a response in a strict JSON format with a single key "questions".
+    Also write a preliminary analysis of the image in Markdown: an objective description of the key visual characteristics followed by the most likely interpretations, noting that it will be refined once the user answers.
+    Return a response in a strict JSON format with the keys "questions" and "preliminary_analysis".
     The value of "questions" should be a list of objects, where each object has "question_text" and a list of "options".
-    Example: {"questions": [{"question_text": "How long has this been present?", "options": ["< 1 day", "1-3 days", "> 3 days"]}]}
+    Example: {"questions": [{"question_text": "How long has this been present?", "options": ["< 1 day", "1-3 days", "> 3 days"]}], "preliminary_analysis": "..."}
     Respond ONLY with the JSON object.
     """
 
-def create_final_analysis_prompt(conversation_history):
-    """
-    Prompt 2: Asks for a final analysis where each interpretation is a
-    separate, self-contained paragraph.
-    """
-    history_str = "\n".join([f"Q: {q}\nA: {a}" for q, a in conversation_history])
+TRIAGE_PROMPT = "Generate the triage questions and preliminary analysis for this image."
 
-    return f"""
-    You are an expert medical analyst AI. You will be provided with a medical image and a triage conversation transcript.
-    Your task is to provide a comprehensive, safe, and transparent final analysis based on BOTH the image and the conversation.
+# Structured-output schema for the triage response, enforced server-side.
+QUESTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "question_text": {"type": "string"},
+                    "options": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["question_text", "options"],
+            },
+        },
+        "preliminary_analysis": {"type": "string"},
+    },
+    "required": ["questions", "preliminary_analysis"],
+}
 
-    **Triage Conversation Transcript:**
-    {history_str}
+# Prompt 2: Asks for a final analysis where each interpretation is a
+# separate, self-contained paragraph. Attached as the analyst model's
+# system instruction; each call only adds the preliminary analysis and
+# the transcript, so the image is not uploaded a second time.
+ANALYST_SYSTEM_INSTRUCTION = """
+    You are an expert medical analyst AI. You will be provided with a preliminary analysis of a medical image, written by a triage assistant that examined the image, and a triage conversation transcript.
+    Your task is to provide a comprehensive, safe, and transparent final analysis based on BOTH the image findings and the conversation.
+    You do NOT have access to the image itself. Every visual detail you mention must come from the supplied preliminary analysis; never add, infer, or embellish visual findings beyond it.
 
     **Analysis Task:**
     Provide a detailed analysis formatted with Markdown, including these exact sections:
     
     1.  **Integrated Observation:** A brief summary combining visual findings with user-provided symptoms.
     
-    2.  **Key Visual Characteristics:** A bulleted list of objective visual details.
+    2.  **Key Visual Characteristics:** A bulleted list of the objective visual details reported in the preliminary analysis, and only those. State that these findings come from the triage assistant's review of the image, not from your own examination.
 
     3.  **Potential Interpretation (Multi-Paragraph Format):**
         - In this section, discuss the most likely interpretations in **separate paragraphs**.
-        - **First Paragraph:** Begin with the most likely possibility. State your confidence level (e.g., "Confidence: High") and then, in a narrative style, explain the supporting visual and user evidence for this conclusion.
+        - **First Paragraph:** Begin with the most likely possibility. State your confidence level (e.g., "Confidence: High") and then, in a narrative style, explain the supporting evidence for this conclusion, drawing visual evidence only from the preliminary analysis and the rest from the user's answers.
         - **Subsequent Paragraph(s):** In a new paragraph, discuss a less likely possibility. State its confidence (e.g., "Confidence: Low") and explain why it is less likely, referencing the available evidence.
         - Discuss no more than three possibilities in total.
 
@@ -88,6 +79,258 @@ def create_final_analysis_prompt(conversation_history):
     Structure your response exactly as requested, with separate paragraphs for each interpretation.
     """
 
+FINAL_ANALYSIS_PREFIX = "**Preliminary Image Analysis:**\n"
+FINAL_ANALYSIS_TRANSCRIPT = "\n\n**Triage Conversation Transcript:**\n"
+
+def create_final_analysis_prompt(preliminary_analysis, conversation_history):
+    """Builds the per-call final analysis prompt from the preliminary analysis and the triage transcript."""
+    history_str = "\n".join(f"Q: {q}\nA: {a}" for q, a in conversation_history)
+    return "".join([FINAL_ANALYSIS_PREFIX, preliminary_analysis, FINAL_ANALYSIS_TRANSCRIPT, history_str])
+
+# --- Load LLM Model ---
+@st.cache_resource
+def configure_genai():
+    """Configures the process-global genai client exactly once."""
+    genai.configure(api_key=st.secrets["GOOGLE_API_KEY"])
+
+@st.cache_resource
+def get_model(name='gemini-1.5-flash-latest', system_instruction=None):
+    """Returns one shared GenerativeModel per model name and system instruction."""
+    return genai.GenerativeModel(name, system_instruction=system_instruction)
+
+try:
+    configure_genai()
+    triage_model = get_model(system_instruction=TRIAGE_SYSTEM_INSTRUCTION)
+    analyst_model = get_model(system_instruction=ANALYST_SYSTEM_INSTRUCTION)
+except KeyError:
+    st.error("🚨 Google API Key not found! Please add it to your Streamlit secrets.")
+    st.stop()
+except Exception as e:
+    st.error(f"An error occurred during model loading: {e}")
+    st.stop()
+
+# --- Background Event Loop ---
+@st.cache_resource
+def get_background_loop():
+    """Runs a single asyncio loop in a daemon thread so API calls can outlive a rerun."""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+# --- Image Preprocessing Pool ---
+@st.cache_resource
+def get_executor():
+    """Worker threads for image preprocessing, so uploads don't block the script thread."""
+    return ThreadPoolExecutor(max_workers=2)
+
+# --- Core API Functions ---
+class GeminiError(Exception):
+    """Raised when a Gemini call fails, so failures are never mistaken for (or cached as) model output."""
+
+def get_gemini_json_response(prompt, image=None):
+    """Gets a JSON response from Gemini, for generating questions."""
+    content = [prompt, image] if image is not None else [prompt]
+    try:
+        response = triage_model.generate_content(
+            content, generation_config={"response_mime_type": "application/json", "response_schema": QUESTIONS_SCHEMA}
+        )
+        return response.text
+    except Exception as e:
+        raise GeminiError(f"API communication failed: {e}") from e
+
+def get_gemini_text_response(prompt, image=None):
+    """Streams a standard text/markdown response from Gemini, for the final analysis."""
+    content = [prompt, image] if image is not None else [prompt]
+    try:
+        response = analyst_model.generate_content(content, stream=True)
+        for chunk in response:
+            yield chunk.text
+    except Exception as e:
+        raise GeminiError(f"API communication failed: {e}") from e
+
+class TextStream:
+    """Chunks of a response filled on the background loop and drained, from the start, by the script thread.
+
+    A stream outlives the script run that created it, so failures are kept as a plain message in `error`
+    rather than as an exception: every rerun re-executes this module and defines new exception classes.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self._cond = threading.Condition()
+
+    def append(self, text):
+        with self._cond:
+            self.chunks.append(text)
+            self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.done = True
+            self.error = error
+            self._cond.notify_all()
+
+    def drain(self):
+        """Yields every chunk as it arrives; check `error` once it is exhausted."""
+        i = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: i < len(self.chunks) or self.done)
+                new, done = self.chunks[i:], self.done
+            i += len(new)
+            yield from new
+            if done:
+                return
+
+async def stream_gemini_text_response_async(prompt, stream, image=None):
+    """Async streaming variant of get_gemini_text_response, used for speculative final analysis."""
+    content = [prompt, image] if image is not None else [prompt]
+    try:
+        response = await analyst_model.generate_content_async(content, stream=True)
+        async for chunk in response:
+            stream.append(chunk.text)
+    except asyncio.CancelledError:
+        stream.finish("speculative analysis was cancelled")
+        raise
+    except Exception as e:
+        stream.finish(f"API communication failed: {e}")
+        return
+    stream.finish()
+
+# --- Response Caches ---
+CACHE_MAX_ENTRIES = 256
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=24 * 60 * 60)
+def cached_triage(image_hash, _image_part):
+    """Triage questions and preliminary analysis for an image, keyed on its SHA-256. Failed or malformed responses raise and are not cached."""
+    data = orjson.loads(get_gemini_json_response(TRIAGE_PROMPT, _image_part))
+    return data["questions"], data["preliminary_analysis"]
+
+@st.cache_resource
+def get_analysis_cache():
+    """Process-wide LRU of completed final analyses, keyed by analysis_cache_key()."""
+    return OrderedDict(), threading.Lock()
+
+def analysis_cache_key(history):
+    """Keys an analysis on everything its prompt is built from: the image, the preliminary analysis and the answers.
+
+    The preliminary analysis comes from the triage cache, which expires, so a re-run triage can pair
+    the same image with a different preliminary text.
+    """
+    preliminary_hash = hashlib.sha256(st.session_state.preliminary_analysis.encode()).hexdigest()
+    return (st.session_state.image_hash, preliminary_hash, tuple(history))
+
+def lookup_analysis(history):
+    """Returns the cached final analysis for this image and history, or None."""
+    cache, lock = get_analysis_cache()
+    key = analysis_cache_key(history)
+    with lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+def store_analysis(history, analysis_text):
+    """Caches a completed final analysis, evicting the least recently used beyond CACHE_MAX_ENTRIES."""
+    cache, lock = get_analysis_cache()
+    key = analysis_cache_key(history)
+    with lock:
+        cache[key] = analysis_text
+        cache.move_to_end(key)
+        while len(cache) > CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+# --- Speculative Final Analysis ---
+def predict_history(conversation_history, triage_questions):
+    """Completes the answers given so far with the first option of every remaining question."""
+    remaining = triage_questions[len(conversation_history):]
+    return list(conversation_history) + [(q["question_text"], q["options"][0]) for q in remaining if q["options"]]
+
+def cancel_speculation():
+    """Cancels the in-flight speculative analysis, if any."""
+    if st.session_state.speculative_task is not None:
+        st.session_state.speculative_task.cancel()
+    st.session_state.speculative_task = None
+    st.session_state.speculative_stream = None
+    st.session_state.speculative_history = None
+
+def start_speculation():
+    """Dispatches the final analysis for the predicted answers while the user is still answering."""
+    predicted = predict_history(st.session_state.conversation_history, st.session_state.triage_questions)
+    st.session_state.speculative_history = predicted
+    if lookup_analysis(predicted) is not None:
+        return
+    final_prompt = create_final_analysis_prompt(st.session_state.preliminary_analysis, predicted)
+    st.session_state.speculative_stream = TextStream()
+    st.session_state.speculative_task = asyncio.run_coroutine_threadsafe(
+        stream_gemini_text_response_async(final_prompt, st.session_state.speculative_stream), get_background_loop()
+    )
+
+def update_speculation():
+    """Keeps the in-flight analysis if the latest answer matches its prediction, otherwise cancels it
+    and, while questions remain, restarts it with a new prediction."""
+    history = st.session_state.conversation_history
+    predicted = st.session_state.speculative_history
+    if predicted is not None and predicted[:len(history)] == history:
+        return
+    cancel_speculation()
+    if len(history) < len(st.session_state.triage_questions):
+        start_speculation()
+
+def render_chunks(placeholder, chunks):
+    """Renders streamed chunks into the placeholder, keeping the partial text in session state."""
+    buffer = ""
+    for text in chunks:
+        buffer += text
+        st.session_state.final_analysis = buffer
+        placeholder.markdown(buffer)
+    return buffer
+
+# --- Image Preprocessing ---
+def prepare_image_bytes(raw_bytes, max_edge=1024, quality=85):
+    """Downscales the image to max_edge on its longest side and re-encodes it as JPEG for upload."""
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(raw_bytes)))
+    if image.mode.startswith("I"):
+        # 16-bit/32-bit grayscale (common for medical scans): stretch the actual value range to 8 bits,
+        # since a plain convert() clips everything above 255 to white.
+        image = image.convert("I")
+        lo, hi = image.getextrema()
+        scale = 255 / (hi - lo) if hi > lo else 0
+        image = image.point(lambda v: v * scale - lo * scale).convert("L")
+    image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    buf = io.BytesIO()
+    image.convert("RGB").save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+def ensure_image_part():
+    """Waits for the background preprocessing of the upload and builds the shared image part once."""
+    if st.session_state.image_part is None:
+        st.session_state.image_bytes = st.session_state.image_future.result()
+        st.session_state.image_hash = hashlib.sha256(st.session_state.image_bytes).hexdigest()
+        st.session_state.image_part = genai.protos.Part(
+            inline_data=genai.protos.Blob(mime_type="image/jpeg", data=st.session_state.image_bytes)
+        )
+
+def reset_for_new_image(file_id):
+    """Drops the image and every result derived from the previous upload."""
+    cancel_speculation()
+    st.session_state.last_file_id = file_id
+    st.session_state.image_future = None
+    st.session_state.image_bytes = None
+    st.session_state.image_hash = None
+    st.session_state.image_part = None
+    st.session_state.conversation_started = False
+    st.session_state.triage_questions = []
+    st.session_state.current_question_index = 0
+    st.session_state.conversation_history = []
+    st.session_state.preliminary_analysis = None
+    st.session_state.final_analysis = None
+    st.session_state.analysis_pending = False
+    st.session_state.in_flight = False
+    st.session_state.triage_error = None
+
 # --- Initialize Session State ---
 if 'conversation_started' not in st.session_state:
     st.session_state.conversation_started = False
@@ -97,10 +340,58 @@ if 'current_question_index' not in st.session_state:
     st.session_state.current_question_index = 0
 if 'conversation_history' not in st.session_state:
     st.session_state.conversation_history = []
+if 'preliminary_analysis' not in st.session_state:
+    st.session_state.preliminary_analysis = None
 if 'final_analysis' not in st.session_state:
     st.session_state.final_analysis = None
-if 'image' not in st.session_state:
-    st.session_state.image = None
+if 'last_file_id' not in st.session_state:
+    st.session_state.last_file_id = None
+if 'image_future' not in st.session_state:
+    st.session_state.image_future = None
+if 'image_bytes' not in st.session_state:
+    st.session_state.image_bytes = None
+if 'image_hash' not in st.session_state:
+    st.session_state.image_hash = None
+if 'image_part' not in st.session_state:
+    st.session_state.image_part = None
+if 'in_flight' not in st.session_state:
+    st.session_state.in_flight = False
+if 'triage_error' not in st.session_state:
+    st.session_state.triage_error = None
+if 'analysis_pending' not in st.session_state:
+    st.session_state.analysis_pending = False
+if 'speculative_task' not in st.session_state:
+    st.session_state.speculative_task = None
+if 'speculative_stream' not in st.session_state:
+    st.session_state.speculative_stream = None
+if 'speculative_history' not in st.session_state:
+    st.session_state.speculative_history = None
+
+# --- Triage Conversation Fragment ---
+@st.fragment
+def render_triage():
+    """Renders the transcript and the active question. Answers rerun only this fragment until the last one."""
+    for q, a in st.session_state.conversation_history:
+        with st.chat_message("assistant"):
+            st.write(q)
+        with st.chat_message("user"):
+            st.write(a)
+
+    current_q = st.session_state.triage_questions[st.session_state.current_question_index]
+    q_text = current_q["question_text"]
+    q_options = current_q["options"]
+
+    with st.chat_message("assistant"):
+        st.write(q_text)
+        cols = st.columns(len(q_options))
+        for i, option in enumerate(q_options):
+            if cols[i].button(option, key=f"q{st.session_state.current_question_index}_{option}"):
+                st.session_state.conversation_history.append((q_text, option))
+                st.session_state.current_question_index += 1
+                update_speculation()
+                if st.session_state.current_question_index < len(st.session_state.triage_questions):
+                    st.rerun(scope="fragment")
+                st.rerun()
 
 # --- Streamlit App Interface ---
 st.title("🧑‍⚕️ AI Medical Consultant")
@@ -114,57 +405,84 @@ with col1:
     uploaded_file = st.file_uploader("1. Upload an image to begin...", type=["jpg", "jpeg", "png"])
 
     if uploaded_file is not None:
-        image = Image.open(uploaded_file).convert("RGB")
-        if 'image' not in st.session_state or st.session_state.image is None:
-             st.session_state.image = image
-        st.image(image, caption="Uploaded Image", use_container_width=True)
-
-        if not st.session_state.conversation_started and st.session_state.final_analysis is None:
-            if st.button("2. Start Triage Conversation", type="primary"):
-                with st.spinner("AI is assessing the image..."):
-                    prompt = create_triage_prompt()
-                    response_str = get_gemini_json_response(prompt, st.session_state.image)
-                    try:
-                        data = json.loads(response_str)
-                        st.session_state.triage_questions = data.get("questions", [])
+        raw_bytes = uploaded_file.getvalue()
+        if uploaded_file.file_id != st.session_state.last_file_id:
+            reset_for_new_image(uploaded_file.file_id)
+            st.session_state.image_future = get_executor().submit(prepare_image_bytes, raw_bytes)
+        try:
+            st.image(raw_bytes, caption="Uploaded Image", use_container_width=True)
+        except (OSError, Image.DecompressionBombError):
+            st.error("The uploaded file could not be displayed as an image.")
+
+        if not st.session_state.conversation_started and not st.session_state.analysis_pending and st.session_state.final_analysis is None:
+            # A click only sets the flag and reruns, so the button is already rendered disabled
+            # while the request is issued on the following run. Errors are kept in session state
+            # and shown after a further rerun, which redraws the button enabled.
+            if st.button("2. Start Triage Conversation", type="primary", disabled=st.session_state.in_flight):
+                st.session_state.in_flight = True
+                st.session_state.triage_error = None
+                st.rerun()
+            if st.session_state.triage_error:
+                st.error(st.session_state.triage_error)
+            if st.session_state.in_flight:
+                try:
+                    with st.spinner("AI is assessing the image..."):
+                        ensure_image_part()
+                        st.session_state.triage_questions, st.session_state.preliminary_analysis = cached_triage(
+                            st.session_state.image_hash, st.session_state.image_part
+                        )
                         st.session_state.conversation_started = True
                         st.session_state.current_question_index = 0
                         st.session_state.conversation_history = []
+                        cancel_speculation()
                         st.rerun()
-                    except (json.JSONDecodeError, KeyError):
-                        st.error("The AI failed to generate valid triage questions. Please try again.")
+                except (OSError, Image.DecompressionBombError):
+                    st.session_state.triage_error = "The uploaded file could not be read as an image. Please upload a different file."
+                except GeminiError as e:
+                    st.session_state.triage_error = f"The AI could not be reached: {e}. Please try again."
+                except (orjson.JSONDecodeError, KeyError):
+                    st.session_state.triage_error = "The AI failed to generate valid triage questions. Please try again."
+                finally:
+                    st.session_state.in_flight = False
+                st.rerun()
 
         if st.session_state.conversation_started:
-            for q, a in st.session_state.conversation_history:
-                with st.chat_message("assistant"):
-                    st.write(q)
-                with st.chat_message("user"):
-                    st.write(a)
-            
             if st.session_state.current_question_index < len(st.session_state.triage_questions):
-                current_q = st.session_state.triage_questions[st.session_state.current_question_index]
-                q_text = current_q["question_text"]
-                q_options = current_q["options"]
-
-                with st.chat_message("assistant"):
-                    st.write(q_text)
-                    cols = st.columns(len(q_options))
-                    for i, option in enumerate(q_options):
-                        if cols[i].button(option, key=f"q{st.session_state.current_question_index}_{option}"):
-                            st.session_state.conversation_history.append((q_text, option))
-                            st.session_state.current_question_index += 1
-                            st.rerun()
+                render_triage()
             else:
                 st.session_state.conversation_started = False
-                with st.spinner("Generating final analysis based on your feedback..."):
-                    final_prompt = create_final_analysis_prompt(st.session_state.conversation_history)
-                    final_analysis_text = get_gemini_text_response(final_prompt, st.session_state.image)
-                    st.session_state.final_analysis = final_analysis_text
-                    st.rerun()
+                st.session_state.analysis_pending = True
 
 with col2:
     st.header("Final AI Analysis")
-    if st.session_state.final_analysis:
+    if st.session_state.analysis_pending:
+        placeholder = st.empty()
+        history = st.session_state.conversation_history
+        stream = st.session_state.speculative_stream
+        try:
+            buffer = lookup_analysis(history)
+            if buffer is not None:
+                placeholder.markdown(buffer)
+            elif stream is not None and st.session_state.speculative_history == history:
+                buffer = render_chunks(placeholder, stream.drain())
+                if stream.error is not None:
+                    # The speculative call failed; fall back to a fresh request.
+                    buffer = None
+            if buffer is None:
+                final_prompt = create_final_analysis_prompt(st.session_state.preliminary_analysis, history)
+                buffer = render_chunks(placeholder, get_gemini_text_response(final_prompt))
+            store_analysis(history, buffer)
+            st.session_state.final_analysis = buffer
+        except GeminiError as e:
+            st.session_state.final_analysis = f"Error: {e}"
+            placeholder.error(st.session_state.final_analysis)
+        finally:
+            cancel_speculation()
+            st.session_state.analysis_pending = False
+    elif st.session_state.final_analysis:
         st.markdown(st.session_state.final_analysis)
     else:
-        st.info("The final, evidence-based analysis will appear here after you complete the triage conversation.")
\ No newline at end of file
+        st.info("The final, evidence-based analysis will appear here after you complete the triage conversation.")
+        if st.session_state.preliminary_analysis:
+            st.caption("Preliminary analysis from the image alone:")
+            st.markdown(st.session_state.preliminary_analysis)
\ No newline at end of file